@@ -1,3 +1,22 @@
 from atollas.dataframe import DataFrame  # noqa
 from atollas.types import *  # noqa
-from atollas.io import *  # noqa
+from atollas import io  # noqa
+
+# the eagerly imported names plus the lazily-built readers
+__all__ = [
+    name for name in globals() if not name.startswith("_") and name != "io"
+] + [*io._input_formats]
+
+
+def __getattr__(name):
+    # read functions live in atollas.io and are created lazily on first use
+    try:
+        return getattr(io, name)
+    except AttributeError:
+        raise AttributeError(
+            f"module {__name__!r} has no attribute {name!r}"
+        ) from None
+
+
+def __dir__():
+    return sorted(set(globals()) | set(io._input_formats))
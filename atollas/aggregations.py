@@ -1,8 +1,15 @@
 import abc
+from functools import cached_property
+
 from pandas import NamedAgg
 
 from atollas.types import ColumnType
 
+try:
+    import numbagg
+except ImportError:
+    numbagg = None
+
 class Aggregation(abc.ABC):
     def __init__(self, column: str):
         self.column = column
@@ -11,10 +18,18 @@ class Aggregation(abc.ABC):
     def output_type(self, input: ColumnType) -> ColumnType:
         ...
 
+    @property
     @abc.abstractmethod
     def pandas_aggregation(self) -> NamedAgg:
         ...
 
+    def grouped_kernel(self):
+        """
+        Compiled grouped reduction for this aggregation, or None when no
+        faster-than-pandas implementation is available.
+        """
+        return None
+
 class SimpleAggregation(Aggregation):
     @abc.abstractproperty
     def func_name(self):
@@ -23,9 +38,15 @@ class SimpleAggregation(Aggregation):
     def output_type(self, input: ColumnType) -> ColumnType:
         return input
 
+    @cached_property
     def pandas_aggregation(self) -> NamedAgg:
         return NamedAgg(column=self.column, aggfunc=self.func_name)
 
+    def grouped_kernel(self):
+        if numbagg is None:
+            return None
+        return getattr(numbagg, f"group_nan{self.func_name}", None)
+
 class Max(SimpleAggregation):
     func_name = "max"
 
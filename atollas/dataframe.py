@@ -1,12 +1,107 @@
-from typing import Callable, Tuple, Union, Dict
+from dataclasses import replace
+from functools import lru_cache
+from typing import Callable, Iterable, Iterator, Tuple, Union, Dict
 
+import numpy as np
 import pandas as pd
+import pyarrow.compute as pc
+
+try:
+    import numba
+except ImportError:
+    numba = None
+
+if numba is not None:
+
+    @numba.njit(cache=True)
+    def _nan_scan(values):
+        # short-circuits on the first nan, with no boolean-mask allocation
+        for value in values:
+            if np.isnan(value):
+                return True
+        return False
 
 from atollas.dataframe_schema import Schema, merge_schemas
 from atollas.types import unique, ColumnType
 from atollas.aggregations import Aggregation
 
 
+@lru_cache(maxsize=None)
+def _jit_predicate(expression: Callable) -> Callable:
+    return numba.njit(expression)
+
+
+def _column_arrays(df: pd.DataFrame) -> dict:
+    """
+    Map column names to their backing arrays without constructing a Series
+    (index, name and all) per column. Reaches into pandas internals with a
+    public-API fallback in case those move.
+    """
+    try:
+        return dict(zip(df.columns, df._mgr.column_arrays))
+    except AttributeError:
+        return {column: df[column].array for column in df.columns}
+
+
+def _has_nulls(array) -> bool:
+    """
+    Null check that reads arrow's null_count for arrow-backed columns
+    (already tracked per chunk, so usually a metadata read rather than a
+    scan), falling back to pandas for anything else.
+    """
+    if isinstance(array, pd.arrays.ArrowExtensionArray):
+        return array._pa_array.null_count > 0
+    if numba is not None and isinstance(array, np.ndarray) and array.dtype.kind == "f":
+        return bool(_nan_scan(array))
+    return bool(pd.isna(array).any())
+
+
+def _all_unique(array) -> bool:
+    """
+    Uniqueness check, arrow-native where possible (see _has_nulls).
+    Nulls count as values, matching pandas' duplicated().
+    """
+    if isinstance(array, pd.arrays.ArrowExtensionArray):
+        return pc.count_distinct(array._pa_array, mode="all").as_py() == len(array)
+    return bool(pd.Index(array).is_unique)
+
+
+def _compiled_groupby(
+    df: pd.DataFrame, by: list, aggregations: Dict[str, Aggregation]
+) -> Union[pd.DataFrame, None]:
+    """
+    Grouped aggregation through numbagg's compiled kernels.
+
+    Returns None when the fast path doesn't apply (numbagg not installed,
+    more than one group key, null keys, non-float columns, or an
+    aggregation without a compiled equivalent) so callers can fall back
+    to the regular pandas groupby. Float columns only: the kernels work
+    on float64, which would silently lose precision on large integers.
+    """
+    if len(by) != 1:
+        return None
+    kernels = {k: v.grouped_kernel() for k, v in aggregations.items()}
+    if any(kernel is None for kernel in kernels.values()):
+        return None
+    if not all(
+        pd.api.types.is_float_dtype(df[v.column]) for v in aggregations.values()
+    ):
+        return None
+    codes, keys = pd.factorize(df[by[0]])
+    if (codes < 0).any():
+        return None
+    out = {by[0]: keys}
+    for name, aggregation in aggregations.items():
+        column = df[aggregation.column]
+        result = kernels[name](
+            column.to_numpy("float64"), codes, num_labels=len(keys)
+        )
+        # back to the input dtype, so results match the schema (and the
+        # pandas fallback) whether or not numbagg is installed
+        out[name] = pd.array(result, dtype=column.dtype)
+    return pd.DataFrame(out)
+
+
 def _output_wrapper(pandas_function: Callable, filetype: str):
     def wrapped_function(self, path: str, **kwargs) -> "DataFrame":
         f"""
@@ -21,20 +116,47 @@ def _output_wrapper(pandas_function: Callable, filetype: str):
 
 
 class DataFrame:
+    __slots__ = ("df", "schema")
+
     def __init__(self, df: pd.DataFrame, schema: Union[Dict[str, ColumnType], Schema]):
         """
         Initialise atollas dataframe based on a pandas dataframe and schema
         """
         if isinstance(schema, dict):
-            schema = Schema(**schema)
+            schema = Schema._from_dict(dict(schema))
         self.df = df
         self.schema = schema
 
-    def to_pandas(self):
+    @classmethod
+    def from_chunks(
+        cls,
+        chunks: Iterable[pd.DataFrame],
+        schema: Union[Dict[str, ColumnType], Schema],
+    ) -> Iterator["DataFrame"]:
+        """
+        Build atollas dataframes from an iterable of pandas dataframes that
+        all share one schema (for instance partitions in a dask or ray style
+        pipeline).
+
+        The schema object is resolved once and shared by every chunk, and
+        each chunk only pays for the dtype casts it actually needs. Null and
+        uniqueness checks are skipped since uniqueness can't meaningfully be
+        verified one chunk at a time - call enforce_schema on the combined
+        result if you need the full guarantees.
+        """
+        if isinstance(schema, dict):
+            schema = Schema._from_dict(dict(schema))
+        for chunk in chunks:
+            yield cls(chunk, schema).enforce_schema(full_check=False)
+
+    def to_pandas(self, copy: bool = False):
         """
         Convert types atollas dataframe into an ordinary pandas dataframe
+
+        By default the underlying dataframe is returned directly, pass
+        copy=True if you want a defensive copy to mutate freely.
         """
-        return self.df.copy()
+        return self.df.copy() if copy else self.df
 
     def enforce_schema(self, full_check=True) -> "DataFrame":
         """
@@ -45,36 +167,44 @@ class DataFrame:
         and uniqueness values.
         """
         schema_dict = self.schema.to_dict()
-        if missing_columns := [i for i in schema_dict if i not in self.df.columns]:
+        df_columns = set(self.df.columns)
+        if any(column not in df_columns for column in schema_dict):
+            missing_columns = [i for i in schema_dict if i not in df_columns]
             raise TypeError(
                 f"{', '.join(missing_columns)} not present in returned df",
             )
+        representations = self.schema._representations
         try:
-            self.df = self.df[list(schema_dict)].astype(
-                {k: v.representation for k, v in schema_dict.items()}
-            )
+            if list(schema_dict) != list(self.df.columns):
+                self.df = self.df[list(schema_dict)]
+            current_dtypes = self.df.dtypes.astype(str)
+            to_cast = {
+                k: r for k, r in representations.items() if current_dtypes[k] != r
+            }
+            if to_cast:
+                self.df = self.df.astype(to_cast)
         except ValueError as exception:
             message = (
                 "The given datatypes are different from as they have been "
                 "specified in the schema, and atollas is not able to enforce "
                 "or convert them into their expected type.\n\n"
                 f"Actual types: {self.df.dtypes.to_dict()}\n"
-                f"Expected schema: { {k: v.representation for k, v in self.schema} }"
+                f"Expected schema: {representations}"
             )
             raise ValueError(message) from exception
-        if not full_check:
+        if not full_check or len(self.df) == 0:
+            # no rows means no nulls and no duplicates
             return self
-        for non_nullable_column in [
-            k for k, v in schema_dict.items() if not v.nullable
-        ]:
-            if any(self.df[non_nullable_column].isnull()):
+        arrays = _column_arrays(self.df)
+        for column in self.schema._non_nullable:
+            if _has_nulls(arrays[column]):
                 raise TypeError(
-                    f'Column "{non_nullable_column}" contains nulls but is typed as non-nullable'
+                    f'Column "{column}" contains nulls but is typed as non-nullable'
                 )
-        for unique_column in [k for k, v in schema_dict.items() if v.unique]:
-            if any(self.df[unique_column].duplicated()):
+        for column in self.schema._unique:
+            if not _all_unique(arrays[column]):
                 raise TypeError(
-                    f'Column "{non_nullable_column}" contains duplicates but is typed as unique'
+                    f'Column "{column}" contains duplicates but is typed as unique'
                 )
 
         return self
@@ -90,13 +220,18 @@ class DataFrame:
         after the operation.
         """
         if isinstance(schema, dict):
-            schema = Schema(**schema)
+            schema = Schema._from_dict(dict(schema))
         return DataFrame(
             df=self.df.assign(**kwargs),
             schema=self.schema + schema,
         ).enforce_schema()
 
-    def filter(self, expression: Callable) -> "DataFrame":
+    def filter(
+        self,
+        expression: Union[Callable, str],
+        engine: str = "python",
+        columns: list[str] | None = None,
+    ) -> "DataFrame":
         """
         Filters a dataframe based on a given expression (function taking a pandas
         dataframe)
@@ -113,7 +248,44 @@ class DataFrame:
         ```python
         df.loc[lambda df: df.some_column == 8]
         ```
+
+        Simple comparisons can also be given as a string, which is handed to
+        pandas' query (evaluated via numexpr where installed, avoiding the
+        intermediate boolean mask):
+
+        ```python
+        df.filter("some_column == 8")
+        ```
+
+        For large numeric filters, passing `engine="numba"` will jit-compile
+        the expression (numba must be installed). In that case the expression
+        receives the raw numpy arrays of the columns named in `columns` rather
+        than the dataframe itself:
+
+        ```python
+        df.filter(lambda a: a == 8, engine="numba", columns=["some_column"])
+        ```
         """
+        if isinstance(expression, str):
+            return DataFrame(
+                df=self.df.query(expression),
+                schema=self.schema,
+            )
+        if engine == "numba":
+            if numba is None:
+                raise ImportError('engine="numba" requires numba to be installed')
+            if not columns:
+                raise ValueError(
+                    'engine="numba" requires the expression\'s columns to be '
+                    'given via the "columns" keyword'
+                )
+            mask = _jit_predicate(expression)(
+                *(self.df[column].to_numpy() for column in columns)
+            )
+            return DataFrame(
+                df=self.df.loc[mask],
+                schema=self.schema,
+            )
         return DataFrame(
             df=self.df.loc[expression],
             schema=self.schema,
@@ -138,7 +310,7 @@ class DataFrame:
         the given schema after the pipe call, and raise an error if not possible.
         """
         if isinstance(schema, dict):
-            schema = Schema(**schema)
+            schema = Schema._from_dict(dict(schema))
         return DataFrame(
             df=self.df.pipe(func, *args, **kwargs),
             schema=schema,
@@ -148,21 +320,22 @@ class DataFrame:
         """
         Rename columns in dataframe
         """
-        new_schema = {k: v if k not in columns else columns[k] for k, v in self.schema}
+        new_schema = {columns.get(k, k): v for k, v in self.schema.to_dict().items()}
         return DataFrame(
             df=self.df.rename(columns=columns),
-            schema=Schema(**new_schema),
+            schema=Schema._from_dict(new_schema),
         )
 
     def drop(self, columns: list[str], errors: str = "raise") -> "DataFrame":
         """
         Drop columns from dataframe
         """
+        new_cols = self.schema.to_dict().copy()
+        for column in columns:
+            new_cols.pop(column, None)
         return DataFrame(
             df=self.df.drop(columns=columns, errors=errors),
-            schema=Schema(
-                **{k: v for k, v in self.schema.to_dict().items() if k not in columns}
-            ),
+            schema=Schema._from_dict(new_cols),
         )
 
     def astype(self, schema: Union[Dict[str, ColumnType], Schema]):
@@ -170,8 +343,8 @@ class DataFrame:
         Will convert the type of columns based on the given schema
         """
         if isinstance(schema, dict):
-            schema = Schema(**schema)
-        schema |= {k: v for k, v in self.schema if k not in schema}
+            schema = Schema._from_dict(dict(schema))
+        schema = Schema._from_dict({**self.schema.to_dict(), **schema.to_dict()})
         return DataFrame(
             df=self.df,
             schema=schema,
@@ -181,14 +354,13 @@ class DataFrame:
         """
         Will drop null fields form the dataframe.
         """
-        new_schema = {}
-        for k, v in self.schema.to_dict().items():
-            if subset is None or k in subset:
-                setattr(v, "nullable", False)
-            new_schema[k] = v
+        new_schema = {
+            k: replace(v, nullable=False) if (subset is None or k in subset) else v
+            for k, v in self.schema.to_dict().items()
+        }
         return DataFrame(
-            df=self.df.dropna(how=how, subset=subset),
-            schema=Schema(**new_schema),
+            df=self.df if len(self.df) == 0 else self.df.dropna(how=how, subset=subset),
+            schema=Schema._from_dict(new_schema),
         )
 
     def merge(
@@ -200,6 +372,7 @@ class DataFrame:
         left_on: str | list[str] = None,
         right_on: str | list[str] = None,
         suffixes: Tuple[str, str] = ("_x", "_y"),
+        fast_inner: bool = True,
     ) -> "DataFrame":
         """
         Join operation for two attolas dataframes.
@@ -211,6 +384,11 @@ class DataFrame:
             - "one-to-many"
             - "many-to-one"
             - "one-to-one"
+
+        For one-to-one inner joins, both sides are pre-filtered to keys
+        present on both sides before merging (each key appears at most once
+        per side, so this doesn't change the result). Pass fast_inner=False
+        to hand the frames to pandas untouched.
         """
         if on:
             left_on, right_on = on, on
@@ -231,11 +409,12 @@ class DataFrame:
             )
             raise ValueError(error_message)
         left_cardinality, _, right_cardinality = cardinality.split("-")
+        left_schema = self.schema.to_dict()
+        right_schema = right.schema.to_dict()
         if left_cardinality == "one":
-            for column, column_type in self.schema:
+            for column, column_type in left_schema.items():
                 if column not in left_on:
                     continue
-
                 if not column_type.unique or column_type.nullable:
                     error_message: str = (
                         f"Type of column {column} is invalid for a one-to-x "
@@ -243,7 +422,7 @@ class DataFrame:
                     )
                     raise ValueError(error_message)
         if right_cardinality == "one":
-            for column, column_type in self.schema:
+            for column, column_type in right_schema.items():
                 if column not in right_on:
                     continue
                 if not column_type.unique or column_type.nullable:
@@ -251,12 +430,20 @@ class DataFrame:
                         f"Type of column {column} is invalid for a x-to-one "
                         "join (must be unique and non-nullable)"
                     )
+                    raise ValueError(error_message)
         new_schema = merge_schemas(
             self.schema, right.schema, left_on, right_on, suffixes[0], suffixes[1]
         )
+        left_df, right_df = self.df, right.df
+        if fast_inner and how == "inner" and cardinality == "one-to-one":
+            left_keys = pd.MultiIndex.from_frame(left_df[left_on])
+            right_keys = pd.MultiIndex.from_frame(right_df[right_on])
+            shared_keys = left_keys.intersection(right_keys)
+            left_df = left_df.loc[left_keys.isin(shared_keys)]
+            right_df = right_df.loc[right_keys.isin(shared_keys)]
         return DataFrame(
-            self.df.merge(
-                right.df, how=how, left_on=left_on, right_on=right_on, suffixes=suffixes
+            left_df.merge(
+                right_df, how=how, left_on=left_on, right_on=right_on, suffixes=suffixes
             ),
             schema=new_schema,
         )
@@ -272,9 +459,11 @@ class DataFrame:
         """
         if isinstance(by, str):
             by = [by]
-        new_df = self.df.groupby(by, as_index=False).agg(
-            **{k: v.pandas_aggregation() for k, v in kwargs.items()}
-        )
+        new_df = _compiled_groupby(self.df, by, kwargs)
+        if new_df is None:
+            new_df = self.df.groupby(by, as_index=False, sort=False, observed=True).agg(
+                **{k: v.pandas_aggregation for k, v in kwargs.items()}
+            )
         new_schema = {}
         for column in by:
             if len(by) == 1:
@@ -288,7 +477,7 @@ class DataFrame:
 
         return DataFrame(
             new_df,
-            schema=Schema(**new_schema),
+            schema=Schema._from_dict(new_schema),
         )
 
     def filter_columns(self, columns: list[str]) -> "DataFrame":
@@ -299,22 +488,35 @@ class DataFrame:
         of pandas' `df.loc[["a", "b"]]`
         """
         new_df = self.df[columns]
-        new_schema = {k: v for k, v in self.schema if k in columns}
-        return DataFrame(new_df, schema=Schema(**new_schema))
-
-    to_csv = _output_wrapper(pd.DataFrame.to_csv, "csv")
-    to_json = _output_wrapper(pd.DataFrame.to_json, "json")
-    to_html = _output_wrapper(pd.DataFrame.to_html, "html")
-    to_latex = _output_wrapper(pd.DataFrame.to_latex, "latex")
-    to_xml = _output_wrapper(pd.DataFrame.to_xml, "xml")
-    to_excel = _output_wrapper(pd.DataFrame.to_excel, "excel")
-    to_hdf = _output_wrapper(pd.DataFrame.to_hdf, "hdf")
-    to_feather = _output_wrapper(pd.DataFrame.to_feather, "feather")
-    to_parquet = _output_wrapper(pd.DataFrame.to_parquet, "parqet")
-    to_orc = _output_wrapper(pd.DataFrame.to_orc, "orc")
-    to_stata = _output_wrapper(pd.DataFrame.to_stata, "stata")
-    to_sql = _output_wrapper(pd.DataFrame.to_sql, "sql")
-    to_gbq = _output_wrapper(pd.DataFrame.to_gbq, "gbq")
+        new_schema = {k: self.schema[k] for k in columns}
+        return DataFrame(new_df, schema=Schema._from_dict(new_schema))
+
+    _output_formats = {
+        "to_csv": "csv",
+        "to_json": "json",
+        "to_html": "html",
+        "to_latex": "latex",
+        "to_xml": "xml",
+        "to_excel": "excel",
+        "to_hdf": "hdf",
+        "to_feather": "feather",
+        "to_parquet": "parquet",
+        "to_orc": "orc",
+        "to_stata": "stata",
+        "to_sql": "sql",
+        "to_gbq": "gbq",
+    }
+
+    def __getattr__(self, name: str):
+        # output wrappers are only built on first use, so unused formats
+        # (and their optional backends) cost nothing at import time
+        if name in self._output_formats:
+            wrapper = _output_wrapper(
+                getattr(pd.DataFrame, name), self._output_formats[name]
+            )
+            setattr(type(self), name, wrapper)
+            return wrapper.__get__(self, type(self))
+        raise AttributeError(name)
 
     def __str__(self):
         return str(self.df) + "\n\n" + "\n".join(f"{k}: {v}" for k, v in self.schema)
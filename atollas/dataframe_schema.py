@@ -1,34 +1,53 @@
 from typing import List, Dict
-from dataclasses import dataclass
 
 from atollas.types import ColumnType, nullable, not_unique
 
-@dataclass
 class Schema:
+    __slots__ = ("_cols", "_representations", "_non_nullable", "_unique")
+
     def __init__(self, **kwargs: ColumnType):
-        for column, column_type in kwargs.items():
-            setattr(self, column, column_type)
+        self._set_columns(dict(kwargs))
 
-    def to_dict(self):
-        return {k: v for k, v in self}
+    def _set_columns(self, columns: Dict[str, ColumnType]):
+        self._cols = columns
+        # derived lookups used on every enforce_schema call, built once
+        # here since schemas are never modified after construction
+        self._representations: Dict[str, str] = {
+            k: v.representation for k, v in columns.items()
+        }
+        self._non_nullable: tuple = tuple(
+            k for k, v in columns.items() if not v.nullable
+        )
+        self._unique: tuple = tuple(k for k, v in columns.items() if v.unique)
 
+    @classmethod
+    def _from_dict(cls, columns: Dict[str, ColumnType]) -> "Schema":
+        """
+        Build a schema straight from a column dict, skipping the kwargs
+        splat (and its copy) in __init__. Internal use only - the dict is
+        taken as-is, so don't hand over one you intend to keep mutating.
+        """
+        schema = cls.__new__(cls)
+        schema._set_columns(columns)
+        return schema
+
+    def to_dict(self):
+        return self._cols
 
     def __add__(self, other: "Schema"):
-        return Schema(**self.to_dict(), **other.to_dict())
+        return Schema._from_dict({**self._cols, **other._cols})
 
     def __iter__(self):
-        for column in dir(self):
-            if not column.startswith("__") and column not in ["to_dict", ""]:
-                yield (column, getattr(self, column))
+        return iter(self._cols.items())
 
     def __str__(self):
-        return str({k: v for k, v in self})
+        return str(self._cols)
 
     def __repr__(self):
         return self.__str__()
 
     def __getitem__(self, i):
-        return self.to_dict()[i]
+        return self._cols[i]
 
 def _identity(x):
     return x
@@ -61,26 +80,22 @@ def merge_schemas(
         init_kwargs[left_col] = merged_type
         if left_col != right_col:
             init_kwargs[right_col] = merged_type
-    shared: List[str] = list(set(right.to_dict()) & set(left.to_dict()))
+    null_applicator = _identity if inner else nullable
+    unique_applicator = _identity if one_to_one else not_unique
+    shared: set = set(right.to_dict()) & set(left.to_dict())
+    skip_right: set = shared | set(l_on)
+    skip_left: set = shared | set(r_on)
     for col in shared:
         if col in l_on:
             continue
-        null_applicator = _identity if inner else nullable
-        unique_applicator = _identity if one_to_one else not_unique
         init_kwargs[f"{col}{l_suffix}"] = null_applicator(unique_applicator(left[col]))
         init_kwargs[f"{col}{r_suffix}"] = null_applicator(unique_applicator(right[col]))
     for col, col_type in right:
-        if col in shared + l_on:
+        if col in skip_right:
             continue
-        null_applicator = _identity if inner else nullable
-        unique_applicator = _identity if one_to_one else not_unique
-        init_kwargs[col] = null_applicator(unique_applicator(col_type))
         init_kwargs[col] = null_applicator(unique_applicator(col_type))
     for col, col_type in left:
-        if col in shared + r_on:
+        if col in skip_left:
             continue
-        null_applicator = _identity if inner else nullable
-        unique_applicator = _identity if one_to_one else not_unique
-        init_kwargs[col] = null_applicator(unique_applicator(col_type))
         init_kwargs[col] = null_applicator(unique_applicator(col_type))
-    return Schema(**init_kwargs)
+    return Schema._from_dict(init_kwargs)
@@ -8,6 +8,10 @@ from atollas.dataframe_schema import Schema
 
 
 def _input_wrapper(pandas_function: Callable, filetype: str):
+    # columnar formats can project down to the schema's columns at the
+    # storage layer, rather than reading everything and dropping the rest
+    columnar = pandas_function in (pd.read_parquet, pd.read_feather, pd.read_orc)
+
     def wrapped_function(
         io: Any, schema: Union[Dict[str, at.ColumnType], Schema], **kwargs
     ):
@@ -17,26 +21,47 @@ def _input_wrapper(pandas_function: Callable, filetype: str):
         Additional keyword arguments are passed into pandas read {filetype}
         function.
         """
-        df = pandas_function(io, **kwargs)
         if isinstance(schema, dict):
-            schema = Schema(**schema)
+            schema = Schema._from_dict(dict(schema))
+        if columnar:
+            kwargs.setdefault("columns", list(schema.to_dict()))
+            kwargs.setdefault("dtype_backend", "pyarrow")
+        df = pandas_function(io, **kwargs)
         return DataFrame(df, schema).enforce_schema()
 
     return wrapped_function
 
 
-read_csv = _input_wrapper(pd.read_csv, "csv")
-read_parquet = _input_wrapper(pd.read_parquet, "parquet")
-read_excel = _input_wrapper(pd.read_excel, "excel")
-read_json = _input_wrapper(pd.read_json, "json")
-json_normalize = _input_wrapper(pd.json_normalize, "json")
-read_html = _input_wrapper(pd.read_html, "html")
-read_xml = _input_wrapper(pd.read_xml, "xml")
-read_feather = _input_wrapper(pd.read_feather, "feather")
-read_sql = _input_wrapper(pd.read_sql, "sql")
-read_orc = _input_wrapper(pd.read_orc, "orc")
-read_sas = _input_wrapper(pd.read_sas, "sas")
-read_stata = _input_wrapper(pd.read_stata, "stata")
-read_spss = _input_wrapper(pd.read_spss, "spss")
-read_gbq = _input_wrapper(pd.read_gbq, "gbq")
-read_fwf = _input_wrapper(pd.read_fwf, "fixed width file")
+_input_formats = {
+    "read_csv": "csv",
+    "read_parquet": "parquet",
+    "read_excel": "excel",
+    "read_json": "json",
+    "json_normalize": "json",
+    "read_html": "html",
+    "read_xml": "xml",
+    "read_feather": "feather",
+    "read_sql": "sql",
+    "read_orc": "orc",
+    "read_sas": "sas",
+    "read_stata": "stata",
+    "read_spss": "spss",
+    "read_gbq": "gbq",
+    "read_fwf": "fixed width file",
+}
+
+# star-import resolves each name through __getattr__, keeping laziness
+__all__ = [*_input_formats]
+
+
+def __getattr__(name: str):
+    # input wrappers are built on first use rather than at import time
+    if name in _input_formats:
+        wrapper = _input_wrapper(getattr(pd, name), _input_formats[name])
+        globals()[name] = wrapper
+        return wrapper
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_input_formats))
@@ -1,27 +1,20 @@
-from copy import deepcopy
-from dataclasses import dataclass
+from dataclasses import dataclass, replace
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class ColumnType:
     representation: str
     nullable: bool = False
     unique: bool = False
 
 def unique(column_type: ColumnType) -> ColumnType:
-    return_type = deepcopy(column_type)
-    return_type.unique = True
-    return return_type
+    return replace(column_type, unique=True)
 
 def not_unique(column_type: ColumnType) -> ColumnType:
-    return_type = deepcopy(column_type)
-    return_type.unique = False
-    return return_type
+    return replace(column_type, unique=False)
 
 def nullable(column_type: ColumnType) -> ColumnType:
-    return_type = deepcopy(column_type)
-    return_type.nullable = True
-    return return_type
+    return replace(column_type, nullable=True)
 
 integer = ColumnType("int64[pyarrow]")
 double = ColumnType("double[pyarrow]")